@@ -5,8 +5,6 @@ import sys
 from datetime import date, datetime
 from pathlib import Path
 from typing import NoReturn
-from sec_connector.client import SECClient
-from sec_connector.models import FilingFilter
 
 def load_json(filepath: Path) -> dict:
     # Load JSON file.
@@ -76,6 +74,9 @@ def main() -> None:
                        default=Path('tests/fixtures/filings_sample.json'),
                        help='Path to filings JSON file')
     args = parser.parse_args()
+    # Imported here so --help and argument errors don't pay for importing pydantic
+    from sec_connector.client import SECClient
+    from sec_connector.models import FilingFilter
     # Load data
     try:
         companies_data = load_json(args.companies_file)
@@ -1,10 +1,10 @@
 # Company Lookup
-from datetime import date
+from datetime import date, datetime
 from typing import Any
 from sec_connector.models import Company, Filing, FilingFilter
 
 class SECClient:
-    def __init__(self, companies_data: dict[str, dict], filings_data: dict[str, list[dict]] | None = None):
+    def __init__(self, companies_data: dict[str, dict], filings_data: dict[str, list[dict | Filing]] | None = None):
         # Convert the indexed format to ticker-based lookup for efficiency
         self._companies_by_ticker = {}
         for key, company_info in companies_data.items():
@@ -37,6 +37,15 @@ class SECClient:
         filings = []
         # Convert raw data to Filing objects
         for filing_data in raw_filings:
+            # Pre-built Filing objects are trusted and skip validation, so they
+            # must already hold valid, normalized values (e.g. model_construct
+            # on clean data). They are returned as is, shared with the client,
+            # so callers must not mutate them; only a mismatched CIK is copied.
+            if isinstance(filing_data, Filing):
+                if filing_data.cik != cik:
+                    filing_data = filing_data.model_copy(update={'cik': cik})
+                filings.append(filing_data)
+                continue
             try:
                 filing = Filing(
                     cik=cik,
@@ -55,25 +64,34 @@ class SECClient:
         filtered.sort(key=lambda f: f.filing_date, reverse=True)
         return filtered[:filters.limit]
     
-    def _parse_date(self, date_str: str) -> date:
-        # Parse date string in YYYY-MM-DD format.
+    def _parse_date(self, value: str | date) -> date:
+        # Parse a YYYY-MM-DD string, or pass an already parsed date through.
+        # datetime subclasses date, so reduce it to its date part first
+        # (otherwise Filing rejects any non-zero time and the filing is dropped)
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
         try:
-            parts = date_str.split('-')
+            parts = value.split('-')
             return date(int(parts[0]), int(parts[1]), int(parts[2]))
         except (ValueError, IndexError):
-            raise ValueError(f"Invalid date format: {date_str}")
+            raise ValueError(f"Invalid date format: {value}")
     
     def _apply_filters(self, filings: list[Filing], filters: FilingFilter) -> list[Filing]:
         # Apply filter criteria to filings list.
         result = filings
 
-        # Filter by form types
+        # Filter by form types (FilingFilter normalizes them, and filings are
+        # either validated above or trusted to be normalized already)
         if filters.form_types:
-            form_types_upper = [ft.upper() for ft in filters.form_types]
-            result = [f for f in result if f.form_type.upper() in form_types_upper]
-        # Filter by date range
-        if filters.date_from:
-            result = [f for f in result if f.filing_date >= filters.date_from]
-        if filters.date_to:
-            result = [f for f in result if f.filing_date <= filters.date_to]
+            result = [f for f in result if f.form_type in filters.form_types]
+        # Filter by date range in a single pass
+        date_from, date_to = filters.date_from, filters.date_to
+        if date_from or date_to:
+            result = [
+                f for f in result
+                if (date_from is None or f.filing_date >= date_from)
+                and (date_to is None or f.filing_date <= date_to)
+            ]
         return result
\ No newline at end of file
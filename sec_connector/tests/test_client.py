@@ -0,0 +1,103 @@
+import pytest
+from datetime import date, datetime
+from sec_connector.client import SECClient
+from sec_connector.models import Filing, FilingFilter
+
+APPLE_CIK = "0000320193"
+
+
+@pytest.fixture
+def raw_filing():
+    return {
+        "company_name": "Apple Inc.",
+        "form_type": "10-Q",
+        "filing_date": "2024-08-01",
+        "accession_number": "0000320193-24-000100"
+    }
+
+
+@pytest.fixture
+def built_filing():
+    return Filing(
+        cik=APPLE_CIK,
+        company_name="Apple Inc.",
+        form_type="10-K",
+        filing_date=date(2024, 11, 1),
+        accession_number="0000320193-24-000123"
+    )
+
+
+class TestPreBuiltFilings:
+    def test_prebuilt_filing_passed_through(self, built_filing):
+        client = SECClient({}, {APPLE_CIK: [built_filing]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter())
+        assert filings[0] is built_filing
+
+    def test_mixed_filings_and_dicts(self, built_filing, raw_filing):
+        client = SECClient({}, {APPLE_CIK: [raw_filing, built_filing]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter())
+        assert [f.form_type for f in filings] == ["10-K", "10-Q"]
+        assert all(isinstance(f, Filing) for f in filings)
+
+    def test_prebuilt_filing_uses_stored_cik(self, built_filing):
+        stray = built_filing.model_copy(update={"cik": "999"})
+        client = SECClient({}, {APPLE_CIK: [stray]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter())
+        assert filings[0].cik == APPLE_CIK
+        assert stray.cik == "999"
+
+    def test_constructed_filing_skips_validation(self):
+        constructed = Filing.model_construct(
+            cik=APPLE_CIK,
+            company_name="Apple Inc.",
+            form_type="8-k",
+            filing_date=date(2024, 2, 1),
+            accession_number="0000320193-24-000050"
+        )
+        client = SECClient({}, {APPLE_CIK: [constructed]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter())
+        # Trusted as is: validators (form type uppercasing) do not run
+        assert filings[0].form_type == "8-k"
+
+
+class TestFilingDates:
+    def test_filing_date_as_date(self, raw_filing):
+        raw_filing["filing_date"] = date(2024, 8, 1)
+        client = SECClient({}, {APPLE_CIK: [raw_filing]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter())
+        assert filings[0].filing_date == date(2024, 8, 1)
+
+    def test_filing_date_as_datetime(self, raw_filing):
+        raw_filing["filing_date"] = datetime(2024, 8, 1, 16, 30)
+        client = SECClient({}, {APPLE_CIK: [raw_filing]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter())
+        assert filings[0].filing_date == date(2024, 8, 1)
+        assert type(filings[0].filing_date) is date
+
+
+class TestFormTypeFilter:
+    def test_form_type_case_insensitive(self, raw_filing):
+        raw_filing["form_type"] = " 10-q "
+        client = SECClient({}, {APPLE_CIK: [raw_filing]})
+        filings = client.list_filings(APPLE_CIK, FilingFilter(form_types=["10-Q"]))
+        assert len(filings) == 1
+        assert FilingFilter(form_types=[" 10-q "]).form_types == ["10-Q"]
+
+
+class TestDateFilter:
+    @pytest.fixture
+    def client(self, raw_filing):
+        filings = []
+        for i, filing_date in enumerate(["2023-11-02", "2024-02-01", "2024-08-01"]):
+            filings.append({**raw_filing, "filing_date": filing_date, "accession_number": str(i)})
+        return SECClient({}, {APPLE_CIK: filings})
+
+    @pytest.mark.parametrize("date_from, date_to, expected", [
+        pytest.param(date(2024, 1, 1), None, ["2", "1"], id="date_from_only"),
+        pytest.param(None, date(2024, 2, 1), ["1", "0"], id="date_to_only"),
+        pytest.param(date(2024, 1, 1), date(2024, 6, 1), ["1"], id="date_range"),
+    ])
+    def test_filter_by_date(self, client, date_from, date_to, expected):
+        filters = FilingFilter(date_from=date_from, date_to=date_to)
+        filings = client.list_filings(APPLE_CIK, filters)
+        assert [f.accession_number for f in filings] == expected